@@ -13,104 +13,422 @@ Research: ChatGPT favors Wikipedia (1.3M citations), Perplexity = 3.2x citations
 """
 
 import re
+import glob
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import hashlib
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 import sys
 
-def optimize_for_chatgpt(html_content: str, config: Dict) -> tuple[str, List[str]]:
+# Patterns used on every document, compiled once at import.
+_STATS_CITATION_RE = re.compile(r'\d+%|\d+x|[\d,]+\s+(?:patients|users|studies)')
+
+def _count_stat_citations(text: str) -> int:
+    return sum(1 for _ in _STATS_CITATION_RE.finditer(text))
+
+def _count_stat_paragraphs(text: str) -> int:
     """
-    ChatGPT optimization: Authority, credentials, depth
-    
-    Preferences:
-    - 1500-2500 words
-    - Author credentials prominent (MD, PhD = +40% citation boost)
-    - Citations to primary sources (PubMed, arXiv)
-    - Answer-first, listicles, how-to guides (+35% citations)
-    - FAQPage and Article schema
-    
-    Args:
-        html_content: HTML content
-        config: Platform configuration
-        
-    Returns:
-        (optimized_html, changes_list)
+    Count <p>...</p> paragraphs (no nested tags) that contain a digit
+
+    Same matches as r'<p>[^<]*\d[^<]*</p>', found by jumping between '<'
+    with str.find and testing each paragraph with C-level substring
+    checks, about twice as fast as the regex on large pages.
+    """
+    count = 0
+    idx = text.find('<p>')
+    while idx != -1:
+        end = text.find('<', idx + 3)
+        if end == -1:
+            break
+        if text.startswith('</p>', end):
+            paragraph = text[idx + 3:end]
+            if (any(digit in paragraph for digit in '0123456789')
+                    or not paragraph.isascii() and any(c.isdecimal() for c in paragraph)):
+                count += 1
+        idx = text.find('<p>', end)
+    return count
+
+@lru_cache(maxsize=None)
+def _ignore_case_re(marker: str) -> re.Pattern:
+    """Case-insensitive literal pattern for marker, compiled once per marker"""
+    return re.compile(re.escape(marker), re.IGNORECASE)
+
+def _ld_json_script(schema: Dict) -> str:
+    """
+    Wrap a schema in a JSON-LD <script> tag
+
+    Serialized compactly: without indent, json.dumps runs on the C encoder
+    instead of the pure-Python pretty printer, and schema.org consumers
+    ignore the whitespace anyway.
+    """
+    return f'\n<script type="application/ld+json">\n{json.dumps(schema, separators=(",", ":"))}\n</script>\n'
+
+# Fixed-shape schemas as pre-serialized _ld_json_script() output: only the
+# string slots are encoded per document (json.dumps on a lone value just
+# escapes it) instead of walking and serializing the whole dict.
+_ARTICLE_SCRIPT = (
+    '\n<script type="application/ld+json">\n'
+    '{{"@context":"https://schema.org","@type":"Article","headline":{headline},'
+    '"author":{{"@type":"Person","name":{name},"honorificSuffix":{credentials}}},'
+    '"datePublished":{published},"dateModified":{modified}}}'
+    '\n</script>\n'
+)
+_LOCALBUSINESS_SCRIPT = (
+    '\n<script type="application/ld+json">\n'
+    '{{"@context":"https://schema.org","@type":"LocalBusiness","name":{name},'
+    '"address":{{"@type":"PostalAddress","streetAddress":{street},"addressLocality":{city},'
+    '"addressRegion":{state},"postalCode":{zip}}},"telephone":{phone}}}'
+    '\n</script>\n'
+)
+
+def _memoized(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    LRU-cache func on its arguments when they are hashable
+
+    Arguments come straight from the user's config, which may hold lists
+    or dicts (e.g. several credentials); those calls run uncached rather
+    than failing on the cache key.
+
+    Example:
+        >>> html = '<html><head></head><body><h1>T</h1></body></html>'
+        >>> author = {'name': 'Jane', 'credentials': ['MD', 'PhD']}
+        >>> '"honorificSuffix":["MD", "PhD"]' in optimize_for_chatgpt(html, {'author': author})[0]
+        True
+        >>> info = {'name': 'Clinic', 'address': {'street': ['1 Main St', 'Suite 2']}}
+        >>> '"streetAddress":["1 Main St", "Suite 2"]' in optimize_for_gemini(html, {'business_info': info})[0]
+        True
+    """
+    cached = lru_cache(maxsize=64)(func)
+
+    @wraps(func)
+    def wrapper(*args):
+        try:
+            hash(args)
+        except TypeError:
+            return func(*args)
+        return cached(*args)
+    return wrapper
+
+# Sites are usually optimized with one config, so these tags repeat
+# byte-for-byte across a batch; render each distinct one once. The Article
+# tag embeds the run timestamp, which is why it is kept to whole seconds.
+@_memoized
+def _article_schema_script(title: str, author_name: str, credentials: str, iso_date: str) -> str:
+    iso_date = json.dumps(iso_date)
+    return _ARTICLE_SCRIPT.format(
+        headline=json.dumps(title),
+        name=json.dumps(author_name),
+        credentials=json.dumps(credentials),
+        published=iso_date,
+        modified=iso_date
+    )
+
+@_memoized
+def _localbusiness_schema_script(name: str, street: str, city: str, state: str,
+                                 zip_code: str, phone: str) -> str:
+    return _LOCALBUSINESS_SCRIPT.format(
+        name=json.dumps(name),
+        street=json.dumps(street),
+        city=json.dumps(city),
+        state=json.dumps(state),
+        zip=json.dumps(zip_code),
+        phone=json.dumps(phone)
+    )
+
+_DATE_MODIFIED_KEY = '"dateModified":'
+
+def _date_modified_spans(html: str):
+    """
+    Yield (start, end) of every "dateModified": "<value>" in html
+
+    Same matches as r'"dateModified":\s*"[^"]+"', but the key is located
+    with str.find, so the regex engine never scans the whole document.
+    """
+    idx = html.find(_DATE_MODIFIED_KEY)
+    while idx != -1:
+        pos = idx + len(_DATE_MODIFIED_KEY)
+        while pos < len(html) and html[pos].isspace():
+            pos += 1
+        end = html.find('"', pos + 1) if html.startswith('"', pos) else -1
+        if end > pos + 1:
+            yield idx, end + 1
+            idx = html.find(_DATE_MODIFIED_KEY, end + 1)
+        else:
+            idx = html.find(_DATE_MODIFIED_KEY, idx + 1)
+
+_BANNER_OPEN = '<div class="last-updated-prominent"'
+
+def _remove_banners(html: str) -> str:
+    """
+    Remove every last-updated-prominent banner div and trailing whitespace
+
+    Walks the <div>/</div> tags after each banner with str.find so a banner
+    containing nested divs is removed up to its own closing tag, rather than
+    cut at the first inner </div> as the old non-greedy regex did.
+    Banners that are never closed are left alone.
+    """
+    parts = []
+    start = 0
+    idx = html.find(_BANNER_OPEN)
+    while idx != -1:
+        pos = html.find('>', idx + len(_BANNER_OPEN)) + 1
+        depth = 1 if pos else 0
+        while depth:
+            close = html.find('</div>', pos)
+            if close == -1:
+                break
+            inner = html.find('<div', pos, close)
+            if inner != -1:
+                depth += 1
+                pos = inner + len('<div')
+            else:
+                depth -= 1
+                pos = close + len('</div>')
+        if depth or not pos:
+            idx = html.find(_BANNER_OPEN, idx + 1)
+            continue
+        while pos < len(html) and html[pos].isspace():
+            pos += 1
+        parts.append(html[start:idx])
+        start = pos
+        idx = html.find(_BANNER_OPEN, start)
+    if not parts:
+        return html
+    parts.append(html[start:])
+    return ''.join(parts)
+
+class _Timestamps(NamedTuple):
+    iso: str
+    display: str
+
+def _timestamps() -> _Timestamps:
+    """Current time as ISO 8601 (to the second) and as a display date"""
+    now = datetime.now()
+    return _Timestamps(now.isoformat(timespec='seconds'), now.strftime('%B %d, %Y'))
+
+class _HtmlEdits:
+    """
+    Pending insertions into an HTML document
+
+    Optimizers queue fragments against anchors (after </h1>, before </head>,
+    before </body>, or before another tag) and apply() splices them all in
+    with one pass, instead of copying the whole document with str.replace()
+    for every insertion. The current time is read once per run so every
+    platform stamps the same dates, and each marker is searched for in the
+    document at most once until the document text itself is rewritten; the
+    offsets found while planning are the ones apply() splices at.
     """
+
+    def __init__(self, html: str):
+        self._html = html
+        self._offsets: Dict[str, int] = {}
+        self._update_dates = False
+        self.now = _timestamps()
+        self.after_h1: List[str] = []
+        self.before: Dict[str, List[str]] = {}
+        self.head: List[str] = []
+        self.body: List[str] = []
+
+    @property
+    def html(self) -> str:
+        return self._html
+
+    @html.setter
+    def html(self, html: str):
+        self._html = html
+        self._offsets.clear()
+        # A rewrite (e.g. banner removal) can delete an anchor that fragments
+        # are already queued against: insert_before() ones fall back to the
+        # end of <body> as they would have at planning time, the others are
+        # dropped, as str.replace() on a missing anchor would have done
+        if self.after_h1 and not self._in_html('</h1>'):
+            self.after_h1.clear()
+        if self.head and not self._in_html('</head>'):
+            self.head.clear()
+        if self.body and not self._in_html('</body>'):
+            self.body.clear()
+        for anchor in [a for a in self.before if not self._in_html(a)]:
+            for fragment in self.before.pop(anchor):
+                self.append_to_body(fragment)
+
+    def _find(self, marker: str) -> int:
+        """Offset of the first marker in the document (memoized), or -1"""
+        offset = self._offsets.get(marker)
+        if offset is None:
+            offset = self._offsets[marker] = self._html.find(marker)
+        return offset
+
+    def _in_html(self, marker: str) -> bool:
+        return self._find(marker) != -1
+
+    def _queued(self):
+        yield from self.after_h1
+        for fragments in self.before.values():
+            yield from fragments
+        yield from self.head
+        yield from self.body
+
+    def has(self, marker: str, ignore_case: bool = False) -> bool:
+        """True if marker is in the document or in a queued fragment"""
+        if ignore_case:
+            # Search case-insensitively rather than lowercasing a copy of the whole document
+            pattern = _ignore_case_re(marker)
+            return pattern.search(self._html) is not None or any(pattern.search(f) for f in self._queued())
+        return self._in_html(marker) or any(marker in f for f in self._queued())
+
+    def count(self, counter: Callable[[str], int]) -> int:
+        """Sum counter() over the document and queued fragments"""
+        return counter(self.html) + sum(counter(fragment) for fragment in self._queued())
+
+    def update_date_modified(self) -> bool:
+        """
+        Stamp every schema dateModified with the current time on apply()
+
+        Returns False if the document has no dateModified, or if an earlier
+        platform in this run already scheduled the update, so multi-platform
+        runs report it only once. Queued fragments don't count: schemas added
+        during the run (e.g. ChatGPT's Article) are already stamped with now.
+        """
+        if self._update_dates or not self._in_html('"dateModified"'):
+            return False
+        self._update_dates = True
+        return True
+
+    def insert_after_h1(self, fragment: str):
+        if self._in_html('</h1>'):
+            self.after_h1.append(fragment)
+
+    def insert_in_head(self, fragment: str):
+        if self._in_html('</head>'):
+            self.head.append(fragment)
+
+    def append_to_body(self, fragment: str):
+        if self._in_html('</body>'):
+            self.body.append(fragment)
+
+    def insert_before(self, anchor: str, fragment: str):
+        """Insert before anchor, falling back to the end of <body>"""
+        if self._in_html(anchor):
+            self.before.setdefault(anchor, []).append(fragment)
+            return
+        for i, queued in enumerate(self.body):
+            pos = queued.find(anchor)
+            if pos != -1:
+                self.body[i:i + 1] = [queued[:pos], fragment, queued[pos:]]
+                return
+        self.append_to_body(fragment)
+
+    def apply(self) -> str:
+        """
+        Apply date updates and splice every queued fragment into the document
+
+        Date rewrites and insertions are collected as (start, end, fragments)
+        spans over the original text and joined once, so the document is
+        copied a single time however many edits there are.
+
+        Example (a rewrite removes an anchor after an edit was queued on it):
+            >>> edits = _HtmlEdits('<body><div class="last-updated-prominent">'
+            ...                    '<h1>T</h1><h2>Contact</h2></div></body>')
+            >>> edits.insert_after_h1('<p>By A</p>')
+            >>> edits.insert_before('<h2>Contact</h2>', '<h2>Reviews</h2>')
+            >>> edits.html = _remove_banners(edits.html)
+            >>> edits.apply()
+            '<body><h2>Reviews</h2></body>'
+        """
+        html = self.html
+        insertions = []
+        if self.after_h1:
+            h1 = self._find('</h1>')
+            insertions.append((h1 + len('</h1>') if h1 != -1 else -1, self.after_h1))
+        for anchor, fragments in self.before.items():
+            insertions.append((self._find(anchor), fragments))
+        if self.head:
+            insertions.append((self._find('</head>'), self.head))
+        if self.body:
+            insertions.append((html.rfind('</body>'), self.body))
+        # Never splice at -1: an anchor missing here is an edit to skip
+        splices = [(offset, offset, fragments) for offset, fragments in insertions if offset != -1]
+        if self._update_dates:
+            stamp = [f'"dateModified": "{self.now.iso}"']
+            splices.extend((start, end, stamp) for start, end in _date_modified_spans(html))
+        if not splices:
+            return html
+
+        # Stable sort: an insertion at the start of a date span goes before it
+        splices.sort(key=lambda splice: splice[0])
+        parts = []
+        start = 0
+        for offset, end, fragments in splices:
+            parts.append(html[start:offset])
+            parts.extend(fragments)
+            start = end
+        parts.append(html[start:])
+        return ''.join(parts)
+
+def _plan_chatgpt(edits: _HtmlEdits, config: Dict) -> List[str]:
+    """Queue ChatGPT edits and return the changes list"""
     changes = []
-    optimized = html_content
     
     # 1. Add author credentials (schema only, or subtle byline)
     if config.get('author'):
         author_name = config['author']['name']
         credentials = config['author'].get('credentials', '')
 
-        # Add subtle author byline (no label, natural)
-        if '<h1>' in optimized:
-            # Add subtle "By Author Name" after H1
-            byline = f'<p class="author"><em>By {author_name}'
-            if credentials:
-                byline += f', {credentials}'
-            byline += f'</em></p>\n\n'
-
-            if 'class="author"' not in optimized:
-                optimized = optimized.replace('</h1>', f'</h1>\n\n{byline}', 1)
-                changes.append(f"Added author: {author_name} {credentials}")
+        # Add subtle "By Author Name" after H1 (no label, natural).
+        # Keyed on </h1> alone: it is the splice point, and its lookup is
+        # memoized, so the planner and insert_after_h1 share one scan.
+        if edits.has('</h1>') and not edits.has('class="author"'):
+            suffix = f', {credentials}' if credentials else ''
+            byline = f'<p class="author"><em>By {author_name}{suffix}</em></p>\n\n'
+            edits.insert_after_h1(f'\n\n{byline}')
+            changes.append(f"Added author: {author_name} {credentials}")
     
     # 2. Update dateModified in schema (no visible date banner)
-    today_iso = datetime.now().isoformat()
-    today_display = datetime.now().strftime('%B %d, %Y')
+    today_display = edits.now.display
 
     # Update schema if present, otherwise will be added later
-    if '"dateModified"' in optimized:
-        optimized = re.sub(
-            r'"dateModified":\s*"[^"]+"',
-            f'"dateModified": "{today_iso}"',
-            optimized
-        )
+    if edits.update_date_modified():
         changes.append(f"Updated dateModified to {today_display}")
     
-    # 3. Add Article schema if not present
-    if 'schema.org/Article' not in optimized:
-        article_schema = {
-            "@context": "https://schema.org",
-            "@type": "Article",
-            "headline": config.get('title', 'Article'),
-            "author": {
-                "@type": "Person",
-                "name": config.get('author', {}).get('name', ''),
-                "honorificSuffix": config.get('author', {}).get('credentials', '')
-            },
-            "datePublished": datetime.now().isoformat(),
-            "dateModified": datetime.now().isoformat()
-        }
-        
-        schema_tag = f'\n<script type="application/ld+json">\n{json.dumps(article_schema, indent=2)}\n</script>\n'
-        
-        if '</head>' in optimized:
-            optimized = optimized.replace('</head>', f'{schema_tag}</head>')
-            changes.append("Added Article schema with author credentials")
+    # 3. Add Article schema if not present (built only when it will be inserted)
+    if not edits.has('schema.org/Article') and edits.has('</head>'):
+        author = config.get('author', {})
+        edits.insert_in_head(_article_schema_script(
+            config.get('title', 'Article'),
+            author.get('name', ''),
+            author.get('credentials', ''),
+            edits.now.iso
+        ))
+        changes.append("Added Article schema with author credentials")
     
     # 4. Add "References" section if citations exist
-    if 'References' not in optimized and config.get('add_references'):
-        references = '\n<h2>References</h2>\n<ol class="references">\n'
-        references += '  <li>Add primary source citations (PubMed, arXiv, academic journals)</li>\n'
-        references += '  <li>Include publisher and year for each citation</li>\n'
-        references += '</ol>\n\n'
+    if not edits.has('References') and config.get('add_references'):
+        references = (
+            '\n<h2>References</h2>\n<ol class="references">\n'
+            '  <li>Add primary source citations (PubMed, arXiv, academic journals)</li>\n'
+            '  <li>Include publisher and year for each citation</li>\n'
+            '</ol>\n\n'
+        )
         
-        optimized = optimized.replace('</body>', f'{references}</body>')
+        edits.append_to_body(references)
         changes.append("Added References section placeholder")
     
-    return optimized, changes
+    return changes
 
-def optimize_for_perplexity(html_content: str, config: Dict) -> tuple[str, List[str]]:
+def optimize_for_chatgpt(html_content: str, config: Dict) -> tuple[str, List[str]]:
     """
-    Perplexity optimization: Freshness, inline citations, structure
+    ChatGPT optimization: Authority, credentials, depth
     
-    Critical: Freshness (3.2x citations for content updated within 30 days)
-    - Update every 2-3 days (aggressive) or minimum 90 days
-    - H2→H3→bullets (40% more citations)
-    - Inline citations with [1], [2] format
-    - dateModified to current date
+    Preferences:
+    - 1500-2500 words
+    - Author credentials prominent (MD, PhD = +40% citation boost)
+    - Citations to primary sources (PubMed, arXiv)
+    - Answer-first, listicles, how-to guides (+35% citations)
+    - FAQPage and Article schema
     
     Args:
         html_content: HTML content
@@ -119,54 +437,46 @@ def optimize_for_perplexity(html_content: str, config: Dict) -> tuple[str, List[
     Returns:
         (optimized_html, changes_list)
     """
+    return _optimize_single(html_content, 'chatgpt', config)
+
+def _plan_perplexity(edits: _HtmlEdits, config: Dict) -> List[str]:
+    """Queue Perplexity edits and return the changes list"""
     changes = []
-    optimized = html_content
     
     # 1. Update dateModified to TODAY (critical for Perplexity)
-    today_iso = datetime.now().isoformat()
-    today_display = datetime.now().strftime('%B %d, %Y')
+    today_display = edits.now.display
 
     # Update in schema (metadata only, no visible banner)
-    if '"dateModified"' in optimized:
-        optimized = re.sub(
-            r'"dateModified":\s*"[^"]+"',
-            f'"dateModified": "{today_iso}"',
-            optimized
-        )
+    if edits.update_date_modified():
         changes.append(f"Updated dateModified to {today_display} (schema)")
 
     # 2. Remove any existing prominent banners (clean up)
-    if '<div class="last-updated-prominent">' in optimized:
-        optimized = re.sub(
-            r'<div class="last-updated-prominent"[^>]*>.*?</div>\s*',
-            '',
-            optimized,
-            flags=re.DOTALL
-        )
+    # Cheap substring test first so clean documents are never rewritten
+    if edits.has(_BANNER_OPEN):
+        edits.html = _remove_banners(edits.html)
     
     # 3. Note citation opportunities (don't add placeholders to HTML)
     if config.get('add_inline_citations'):
         # Count paragraphs with statistics that could use citations
-        stat_paragraphs = len(re.findall(r'<p>[^<]*\d+[^<]*</p>', optimized))
+        stat_paragraphs = edits.count(_count_stat_paragraphs) if edits.has('<p>') else 0
         if stat_paragraphs > 0:
             changes.append(f"Found {stat_paragraphs} paragraphs that could use inline citations [1], [2]")
     
     # 4. Ensure H2→H3→bullet structure hint
-    if '<h2>' in optimized and '<h3>' not in optimized:
+    if edits.has('<h2>') and not edits.has('<h3>'):
         changes.append("Note: Consider adding H3 subheadings under H2s for better structure")
     
-    return optimized, changes
+    return changes
 
-def optimize_for_claude(html_content: str, config: Dict) -> tuple[str, List[str]]:
+def optimize_for_perplexity(html_content: str, config: Dict) -> tuple[str, List[str]]:
     """
-    Claude optimization: Primary sources, transparent methodology
+    Perplexity optimization: Freshness, inline citations, structure
     
-    Preferences:
-    - 5-8 primary source citations (publisher + year)
-    - Transparent methodology section
-    - Acknowledge limitations
-    - Inline citations with clickable links
-    - 91.2% attribution accuracy (high standards)
+    Critical: Freshness (3.2x citations for content updated within 30 days)
+    - Update every 2-3 days (aggressive) or minimum 90 days
+    - H2→H3→bullets (40% more citations)
+    - Inline citations with [1], [2] format
+    - dateModified to current date
     
     Args:
         html_content: HTML content
@@ -175,43 +485,49 @@ def optimize_for_claude(html_content: str, config: Dict) -> tuple[str, List[str]
     Returns:
         (optimized_html, changes_list)
     """
+    return _optimize_single(html_content, 'perplexity', config)
+
+def _plan_claude(edits: _HtmlEdits, config: Dict) -> List[str]:
+    """Queue Claude edits and return the changes list"""
     changes = []
-    optimized = html_content
     
     # 1. Add "Methodology" section
-    if 'Methodology' not in optimized and config.get('add_methodology'):
-        methodology = '\n<h2>Methodology</h2>\n'
-        methodology += '<p>This content is based on [describe sources and approach]. '
-        methodology += 'Primary sources include peer-reviewed research, clinical guidelines, '
-        methodology += 'and expert consensus statements.</p>\n\n'
+    if not edits.has('Methodology') and config.get('add_methodology'):
+        methodology = (
+            '\n<h2>Methodology</h2>\n'
+            '<p>This content is based on [describe sources and approach]. '
+            'Primary sources include peer-reviewed research, clinical guidelines, '
+            'and expert consensus statements.</p>\n\n'
+        )
         
         # Insert before references or before closing body
-        if '<h2>References</h2>' in optimized:
-            optimized = optimized.replace('<h2>References</h2>', f'{methodology}<h2>References</h2>')
-        else:
-            optimized = optimized.replace('</body>', f'{methodology}</body>')
+        edits.insert_before('<h2>References</h2>', methodology)
         changes.append("Added Methodology section")
     
     # 2. Add "Limitations" section
-    if 'Limitations' not in optimized and config.get('add_limitations'):
-        limitations = '\n<h2>Limitations</h2>\n'
-        limitations += '<p>This information is current as of [date]. Readers should consult '
-        limitations += 'primary sources and healthcare professionals for specific guidance. '
-        limitations += 'Individual circumstances may vary.</p>\n\n'
+    if not edits.has('Limitations') and config.get('add_limitations'):
+        limitations = (
+            '\n<h2>Limitations</h2>\n'
+            '<p>This information is current as of [date]. Readers should consult '
+            'primary sources and healthcare professionals for specific guidance. '
+            'Individual circumstances may vary.</p>\n\n'
+        )
         
-        optimized = optimized.replace('</body>', f'{limitations}</body>')
+        edits.append_to_body(limitations)
         changes.append("Added Limitations section")
     
     # 3. Add "Data Sources" section
-    if 'Data Sources' not in optimized and config.get('add_data_sources'):
-        sources = '\n<h2>Data Sources</h2>\n'
-        sources += '<ul>\n'
-        sources += '  <li>Primary research: [Specify journals, databases]</li>\n'
-        sources += '  <li>Clinical guidelines: [Specify organizations]</li>\n'
-        sources += '  <li>Expert consensus: [Specify authorities]</li>\n'
-        sources += '</ul>\n\n'
+    if not edits.has('Data Sources') and config.get('add_data_sources'):
+        sources = (
+            '\n<h2>Data Sources</h2>\n'
+            '<ul>\n'
+            '  <li>Primary research: [Specify journals, databases]</li>\n'
+            '  <li>Clinical guidelines: [Specify organizations]</li>\n'
+            '  <li>Expert consensus: [Specify authorities]</li>\n'
+            '</ul>\n\n'
+        )
         
-        optimized = optimized.replace('</body>', f'{sources}</body>')
+        edits.append_to_body(sources)
         changes.append("Added Data Sources section")
     
     # 4. Format citations as clickable links
@@ -219,94 +535,86 @@ def optimize_for_claude(html_content: str, config: Dict) -> tuple[str, List[str]
         # Convert [1], [2] style to clickable if references exist
         changes.append("Note: Ensure citations are clickable links to references")
     
-    return optimized, changes
+    return changes
 
-def optimize_for_gemini(html_content: str, config: Dict) -> tuple[str, List[str]]:
+def optimize_for_claude(html_content: str, config: Dict) -> tuple[str, List[str]]:
     """
-    Gemini optimization: Community validation, Google ecosystem
-
+    Claude optimization: Primary sources, transparent methodology
+    
     Preferences:
-    - User reviews/testimonials
-    - Google Business Profile integration
-    - Local citations (NAP consistency)
-    - Community validation signals
-    - Traditional authority signals (awards, press)
-
+    - 5-8 primary source citations (publisher + year)
+    - Transparent methodology section
+    - Acknowledge limitations
+    - Inline citations with clickable links
+    - 91.2% attribution accuracy (high standards)
+    
     Args:
         html_content: HTML content
         config: Platform configuration
-
+        
     Returns:
         (optimized_html, changes_list)
     """
+    return _optimize_single(html_content, 'claude', config)
+
+def _plan_gemini(edits: _HtmlEdits, config: Dict) -> List[str]:
+    """Queue Gemini edits and return the changes list"""
     changes = []
-    optimized = html_content
 
     # 1. Add testimonials section if provided
-    if config.get('testimonials') and 'Testimonials' not in optimized:
-        testimonials = '\n<h2>What Our Clients Say</h2>\n'
-        for t in config['testimonials'][:3]:  # Max 3
-            testimonials += f'<blockquote>\n'
-            testimonials += f'  <p>"{t.get("text", "")}"</p>\n'
-            testimonials += f'  <footer>— {t.get("name", "Client")}</footer>\n'
-            testimonials += f'</blockquote>\n\n'
+    if config.get('testimonials') and not edits.has('Testimonials'):
+        shown = config['testimonials'][:3]  # Max 3
+        testimonials = '\n<h2>What Our Clients Say</h2>\n' + ''.join(
+            f'<blockquote>\n'
+            f'  <p>"{t.get("text", "")}"</p>\n'
+            f'  <footer>— {t.get("name", "Client")}</footer>\n'
+            f'</blockquote>\n\n'
+            for t in shown
+        )
 
         # Insert before contact section or before closing body
-        if '<h2>Contact</h2>' in optimized:
-            optimized = optimized.replace('<h2>Contact</h2>', f'{testimonials}<h2>Contact</h2>')
-        else:
-            optimized = optimized.replace('</body>', f'{testimonials}</body>')
-        changes.append(f"Added testimonials section ({len(config['testimonials'])} reviews)")
+        edits.insert_before('<h2>Contact</h2>', testimonials)
+        changes.append(f"Added testimonials section ({len(shown)} reviews)")
 
     # 2. Ensure NAP (Name, Address, Phone) consistency
-    if config.get('business_info'):
+    business_info = config.get('business_info')
+    if business_info and edits.has('</head>') and not edits.has('LocalBusiness'):
         # Add Organization schema for GMB
-        org_schema = {
-            "@context": "https://schema.org",
-            "@type": "LocalBusiness",
-            "name": config['business_info'].get('name', ''),
-            "address": {
-                "@type": "PostalAddress",
-                "streetAddress": config['business_info'].get('address', {}).get('street', ''),
-                "addressLocality": config['business_info'].get('address', {}).get('city', ''),
-                "addressRegion": config['business_info'].get('address', {}).get('state', ''),
-                "postalCode": config['business_info'].get('address', {}).get('zip', '')
-            },
-            "telephone": config['business_info'].get('phone', '')
-        }
-
-        schema_tag = f'\n<script type="application/ld+json">\n{json.dumps(org_schema, indent=2)}\n</script>\n'
-
-        if '</head>' in optimized and 'LocalBusiness' not in optimized:
-            optimized = optimized.replace('</head>', f'{schema_tag}</head>')
-            changes.append("Added LocalBusiness schema for Google Business Profile")
+        address = business_info.get('address', {})
+        edits.insert_in_head(_localbusiness_schema_script(
+            business_info.get('name', ''),
+            address.get('street', ''),
+            address.get('city', ''),
+            address.get('state', ''),
+            address.get('zip', ''),
+            business_info.get('phone', '')
+        ))
+        changes.append("Added LocalBusiness schema for Google Business Profile")
 
     # 3. Add awards/recognition if provided
-    if config.get('awards') and 'Awards' not in optimized:
-        awards = '\n<h2>Awards & Recognition</h2>\n<ul>\n'
-        for award in config['awards'][:5]:
-            awards += f'  <li>{award}</li>\n'
-        awards += '</ul>\n\n'
+    if config.get('awards') and not edits.has('Awards'):
+        shown = config['awards'][:5]
+        awards = (
+            '\n<h2>Awards & Recognition</h2>\n<ul>\n'
+            + ''.join(f'  <li>{award}</li>\n' for award in shown)
+            + '</ul>\n\n'
+        )
 
-        optimized = optimized.replace('</body>', f'{awards}</body>')
-        changes.append(f"Added Awards & Recognition ({len(config['awards'])} awards)")
+        edits.append_to_body(awards)
+        changes.append(f"Added Awards & Recognition ({len(shown)} awards)")
 
-    return optimized, changes
+    return changes
 
-def optimize_for_grokipedia(html_content: str, config: Dict) -> tuple[str, List[str]]:
+def optimize_for_gemini(html_content: str, config: Dict) -> tuple[str, List[str]]:
     """
-    Grokipedia optimization: RAG-based citation, primary sources, transparency
-
-    Launched: October 27, 2025 by xAI
-    Citations: 885K articles, uses Wikipedia + RAG (Retrieval-Augmented Generation)
+    Gemini optimization: Community validation, Google ecosystem
 
     Preferences:
-    - Primary source citations (clear sourcing)
-    - Consistent attribution and licensing
-    - Transparent update history (versioning, changelog)
-    - Stable technical accessibility
-    - Factual accuracy with verifiable data
-    - 20-30% better factual consistency with RAG
+    - User reviews/testimonials
+    - Google Business Profile integration
+    - Local citations (NAP consistency)
+    - Community validation signals
+    - Traditional authority signals (awards, press)
 
     Args:
         html_content: HTML content
@@ -315,58 +623,64 @@ def optimize_for_grokipedia(html_content: str, config: Dict) -> tuple[str, List[
     Returns:
         (optimized_html, changes_list)
     """
+    return _optimize_single(html_content, 'gemini', config)
+
+def _plan_grokipedia(edits: _HtmlEdits, config: Dict) -> List[str]:
+    """Queue Grokipedia edits and return the changes list"""
     changes = []
-    optimized = html_content
 
     # 1. Add clear source attribution (critical for RAG retrieval)
-    if config.get('primary_sources') and 'Primary Sources' not in optimized:
-        sources = '\n<h2>Primary Sources</h2>\n<ul class="primary-sources">\n'
-        for source in config['primary_sources'][:5]:
-            sources += f'  <li><a href="{source.get("url", "#")}" rel="nofollow">'
-            sources += f'{source.get("title", "Source")}</a> — {source.get("publisher", "")}'
-            if source.get('year'):
-                sources += f' ({source.get("year")})'
-            sources += '</li>\n'
-        sources += '</ul>\n\n'
+    if config.get('primary_sources') and not edits.has('Primary Sources'):
+        shown = config['primary_sources'][:5]
+        sources = (
+            '\n<h2>Primary Sources</h2>\n<ul class="primary-sources">\n'
+            + ''.join(
+                f'  <li><a href="{source.get("url", "#")}" rel="nofollow">'
+                f'{source.get("title", "Source")}</a> — {source.get("publisher", "")}'
+                f'{" (%s)" % source["year"] if source.get("year") else ""}</li>\n'
+                for source in shown
+            )
+            + '</ul>\n\n'
+        )
 
         # Insert before References or before closing body
-        if '<h2>References</h2>' in optimized:
-            optimized = optimized.replace('<h2>References</h2>', f'{sources}<h2>References</h2>')
-        else:
-            optimized = optimized.replace('</body>', f'{sources}</body>')
-        changes.append(f"Added Primary Sources section ({len(config['primary_sources'])} sources)")
+        edits.insert_before('<h2>References</h2>', sources)
+        changes.append(f"Added Primary Sources section ({len(shown)} sources)")
 
     # 2. Add version/update history (transparency signal)
-    if config.get('add_version_history') and 'Version History' not in optimized:
-        today_iso = datetime.now().isoformat()
-        today_display = datetime.now().strftime('%B %d, %Y')
+    if config.get('add_version_history') and not edits.has('Version History'):
+        today_display = edits.now.display
 
-        history = '\n<h2>Version History</h2>\n<ul class="version-history">\n'
-        history += f'  <li><strong>v1.0</strong> — {today_display}: Initial publication</li>\n'
-        history += '</ul>\n\n'
+        history = (
+            '\n<h2>Version History</h2>\n<ul class="version-history">\n'
+            f'  <li><strong>v1.0</strong> — {today_display}: Initial publication</li>\n'
+            '</ul>\n\n'
+        )
 
-        optimized = optimized.replace('</body>', f'{history}</body>')
+        edits.append_to_body(history)
         changes.append("Added Version History section")
 
     # 3. Ensure license/attribution clarity (CC-BY-SA if Wikipedia-derived)
-    if config.get('wikipedia_derived') and 'license' not in optimized.lower():
-        license_notice = '\n<footer class="license">\n'
-        license_notice += '  <p><small>Portions of this content are derived from Wikipedia, '
-        license_notice += 'licensed under <a href="https://creativecommons.org/licenses/by-sa/4.0/" '
-        license_notice += 'rel="license">CC BY-SA 4.0</a>.</small></p>\n'
-        license_notice += '</footer>\n\n'
-
-        optimized = optimized.replace('</body>', f'{license_notice}</body>')
+    if config.get('wikipedia_derived') and not edits.has('license', ignore_case=True):
+        license_notice = (
+            '\n<footer class="license">\n'
+            '  <p><small>Portions of this content are derived from Wikipedia, '
+            'licensed under <a href="https://creativecommons.org/licenses/by-sa/4.0/" '
+            'rel="license">CC BY-SA 4.0</a>.</small></p>\n'
+            '</footer>\n\n'
+        )
+
+        edits.append_to_body(license_notice)
         changes.append("Added CC-BY-SA license attribution")
 
     # 4. Add structured changelog schema (machine-readable versioning)
-    if config.get('add_changelog_schema'):
+    if config.get('add_changelog_schema') and edits.has('</head>') and not edits.has('"version"'):
         changelog_schema = {
             "@context": "https://schema.org",
             "@type": "Article",
             "headline": config.get('title', 'Article'),
-            "datePublished": datetime.now().isoformat(),
-            "dateModified": datetime.now().isoformat(),
+            "datePublished": edits.now.iso,
+            "dateModified": edits.now.iso,
             "version": "1.0",
             "isBasedOn": config.get('source_url', '') if config.get('wikipedia_derived') else None
         }
@@ -374,20 +688,72 @@ def optimize_for_grokipedia(html_content: str, config: Dict) -> tuple[str, List[
         # Remove None values
         changelog_schema = {k: v for k, v in changelog_schema.items() if v is not None}
 
-        schema_tag = f'\n<script type="application/ld+json">\n{json.dumps(changelog_schema, indent=2)}\n</script>\n'
-
-        if '</head>' in optimized and '"version"' not in optimized:
-            optimized = optimized.replace('</head>', f'{schema_tag}</head>')
-            changes.append("Added versioned Article schema for changelog tracking")
+        edits.insert_in_head(_ld_json_script(changelog_schema))
+        changes.append("Added versioned Article schema for changelog tracking")
 
     # 5. Ensure inline citations with clear links (RAG retrieval benefit)
     if config.get('enhance_inline_citations'):
         # Check for citation opportunities
-        stat_count = len(re.findall(r'\d+%|\d+x|[\d,]+\s+(patients|users|studies)', optimized))
+        stat_count = edits.count(_count_stat_citations)
         if stat_count > 0:
             changes.append(f"Found {stat_count} statistics that should have inline citations [1], [2]")
 
-    return optimized, changes
+    return changes
+
+def optimize_for_grokipedia(html_content: str, config: Dict) -> tuple[str, List[str]]:
+    """
+    Grokipedia optimization: RAG-based citation, primary sources, transparency
+
+    Launched: October 27, 2025 by xAI
+    Citations: 885K articles, uses Wikipedia + RAG (Retrieval-Augmented Generation)
+
+    Preferences:
+    - Primary source citations (clear sourcing)
+    - Consistent attribution and licensing
+    - Transparent update history (versioning, changelog)
+    - Stable technical accessibility
+    - Factual accuracy with verifiable data
+    - 20-30% better factual consistency with RAG
+
+    Args:
+        html_content: HTML content
+        config: Platform configuration
+
+    Returns:
+        (optimized_html, changes_list)
+    """
+    return _optimize_single(html_content, 'grokipedia', config)
+
+# Platform planners in priority order
+_PLANNERS = {
+    'chatgpt': _plan_chatgpt,
+    'perplexity': _plan_perplexity,
+    'claude': _plan_claude,
+    'gemini': _plan_gemini,
+    'grokipedia': _plan_grokipedia
+}
+
+# Public single-platform entry points, in the same order; the CLI
+# validates and dispatches platforms through this table
+PLATFORM_FUNCS = {
+    'chatgpt': optimize_for_chatgpt,
+    'perplexity': optimize_for_perplexity,
+    'claude': optimize_for_claude,
+    'gemini': optimize_for_gemini,
+    'grokipedia': optimize_for_grokipedia
+}
+
+def _optimize(html_content: str, platforms: Tuple[str, ...], config: Dict):
+    """Queue every platform's edits on one document and splice once"""
+    edits = _HtmlEdits(html_content)
+    platform_changes = tuple(
+        (platform, tuple(_PLANNERS[platform](edits, config))) for platform in platforms
+    )
+    return edits.apply(), platform_changes
+
+def _optimize_single(html_content: str, platform: str, config: Dict) -> tuple[str, List[str]]:
+    optimized, platform_changes = _optimize(html_content, (platform,), config)
+    return optimized, list(platform_changes[0][1])
 
 def optimize_multi_platform(html_content: str, platforms: List[str], config: Dict) -> tuple[str, List[str]]:
     """
@@ -401,29 +767,254 @@ def optimize_multi_platform(html_content: str, platforms: List[str], config: Dic
     Returns:
         (optimized_html, combined_changes_list)
     """
-    optimized = html_content
-    all_changes = []
+    all_changes: List[str] = []
 
-    # Apply optimizations in priority order
-    platform_funcs = {
-        'chatgpt': optimize_for_chatgpt,
-        'perplexity': optimize_for_perplexity,
-        'claude': optimize_for_claude,
-        'gemini': optimize_for_gemini,
-        'grokipedia': optimize_for_grokipedia
-    }
+    # Queue optimizations in priority order, then splice once
+    optimized, platform_changes = _optimize(
+        html_content,
+        tuple(platform for platform in platforms if platform in _PLANNERS),
+        config
+    )
 
-    for platform in platforms:
-        if platform in platform_funcs:
-            optimized, changes = platform_funcs[platform](optimized, config)
-            all_changes.extend([f"[{platform.upper()}] {c}" for c in changes])
+    for platform, changes in platform_changes:
+        prefix = f"[{platform.upper()}] "
+        all_changes.extend(prefix + c for c in changes)
 
     return optimized, all_changes
 
+# Basic config used by the CLI (user can customize)
+CLI_CONFIG = {
+    'author': {
+        'name': 'Expert Author',
+        'credentials': 'PhD'
+    },
+    'title': 'Article Title',
+    'add_references': True,
+    'add_methodology': True,
+    'add_limitations': True,
+    'add_data_sources': True,
+    'add_inline_citations': True,
+    'make_citations_clickable': True
+}
+
+# On-disk results, so re-running over an unchanged site skips optimization.
+# Opt-in (PLATFORM_OPTIMIZER_CACHE=1): every miss stores a full copy of the
+# page. Entries are keyed on this module's source, so any code change
+# orphans them, and on the day, so main() prunes entries written before today.
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'platform_optimizer'
+)
+
+@lru_cache(maxsize=None)
+def _cache_version() -> Optional[str]:
+    """Digest of this module's source, or None if it can't be read (no caching)"""
+    try:
+        with open(__file__, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return None
+
+def _prune_cache():
+    """Remove disk cache entries written before today; their keys can't match again"""
+    if not os.environ.get('PLATFORM_OPTIMIZER_CACHE'):
+        return
+    midnight = datetime.combine(date.today(), datetime.min.time()).timestamp()
+    try:
+        entries = os.scandir(_CACHE_DIR)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < midnight:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+def _cache_paths(source: Union[bytes, mmap.mmap], platform: str, config: Dict) -> Optional[Tuple[str, str]]:
+    """
+    (html_path, changes_path) of the cache entry for one optimization, or None
+
+    Keyed on the input bytes, platform, config and current day (dates
+    stamped into the output stay current to the day).
+    """
+    if not os.environ.get('PLATFORM_OPTIMIZER_CACHE') or not _cache_version():
+        return None
+    try:
+        config_key = json.dumps(config, sort_keys=True)
+    except TypeError:
+        return None
+    settings = f'{_cache_version()}|{config_key}|{date.today().isoformat()}'.encode('utf-8')
+    name = (f'{hashlib.sha256(source).hexdigest()[:16]}-{platform}-'
+            f'{hashlib.sha256(settings).hexdigest()[:8]}')
+    base = os.path.join(_CACHE_DIR, name)
+    return f'{base}.html', f'{base}.changes.json'
+
+def _write_bytes(path: str, data: bytes):
+    """Write data with os.write straight to the fd (no buffered file object)"""
+    view = memoryview(data)
+    # O_BINARY: Windows opens fds in text mode (LF -> CRLF) without it.
+    # 0o666 is masked by the umask, as with open()
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_output(path: str, data: bytes):
+    """Write data to path unless it already holds exactly these bytes"""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return
+    except OSError:
+        pass
+    _write_bytes(path, data)
+
+def _read_cache(cache: Tuple[str, str]) -> Optional[Tuple[bytes, List[str]]]:
+    """(optimized_bytes, changes) stored at cache, or None on a miss"""
+    try:
+        with open(cache[0], 'rb') as f:
+            optimized = f.read()
+        with open(cache[1], 'rb') as f:
+            return optimized, json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+# Inputs at least this large are mapped rather than read, so hashing and
+# decoding work straight from the page cache without a bytes copy
+_MMAP_MIN_SIZE = 1 << 20
+
+def _output_path(file_path: str, platform: str) -> str:
+    """Default output path: page.html -> page-<platform>.html"""
+    base = file_path.rsplit('.', 1)[0]
+    return f"{base}-{platform}.html"
+
+def _optimize_file(file_path: str, platform: str, config: Dict,
+                   output_path: Optional[str] = None) -> tuple[str, List[str]]:
+    """
+    Read, optimize and write one HTML file
+
+    Returns:
+        (output_path, changes_list)
+    """
+    # Read file as raw bytes (decoded only on a cache miss)
+    raw: Union[bytes, mmap.mmap]
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            raw = f.read()
+
+    # Determine output path
+    if output_path is None:
+        output_path = _output_path(file_path, platform)
+
+    # Done with the input before anything is written, in case output_path
+    # is the input file itself
+    try:
+        cache = _cache_paths(raw, platform, config)
+        cached = _read_cache(cache) if cache else None
+        text = '' if cached else str(raw, 'utf-8')
+    finally:
+        if isinstance(raw, mmap.mmap):
+            raw.close()
+
+    if cached:
+        _write_output(output_path, cached[0])
+        return output_path, cached[1]
+
+    # Apply optimization
+    if platform == 'multi':
+        optimized, changes = optimize_multi_platform(text, list(PLATFORM_FUNCS), config)
+    else:
+        optimized, changes = PLATFORM_FUNCS[platform](text, config)
+
+    # Write optimized file: encode once
+    data = optimized.encode('utf-8')
+    _write_output(output_path, data)
+
+    if cache:
+        # Best effort. Each file is renamed into place so concurrent batch
+        # workers never read a partial entry, and the changes file goes
+        # last so a reader never sees an entry without its HTML.
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            for path, entry in zip(cache, (data, json.dumps(changes).encode('utf-8'))):
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                _write_bytes(tmp_path, entry)
+                os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    return output_path, changes
+
+def _is_pattern(path: str) -> bool:
+    """True if path is a glob to expand rather than an existing file name"""
+    return not os.path.exists(path) and any(c in path for c in '*?[')
+
+def _expand_paths(paths: List[str], platform: str) -> List[str]:
+    """
+    Expand directories and glob patterns into HTML file paths
+
+    Existing paths are used as given (directories contribute their *.html
+    files, recursively), so names like page[1].html need no escaping.
+    Files this run writes itself (page-<platform>.html for an input
+    page.html) are skipped, so re-running over a site's files, however
+    they were listed, doesn't optimize the previous run's output.
+
+    Raises:
+        FileNotFoundError: a directory or glob matched no input files
+    """
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            matches = glob.glob(os.path.join(glob.escape(path), '**', '*.html'), recursive=True)
+        elif _is_pattern(path):
+            matches = glob.glob(path, recursive=True)
+        else:
+            expanded.append(path)
+            continue
+        if not matches:
+            raise FileNotFoundError(f"No HTML files match: {path}")
+        expanded.extend(sorted(matches))
+    outputs = {os.path.normpath(_output_path(p, platform)) for p in expanded}
+    return [p for p in expanded if os.path.normpath(p) not in outputs]
+
+def optimize_batch(file_paths: List[str], platform: str, config: Dict
+                   ) -> Tuple[List[tuple[str, List[str]]], List[Tuple[str, Exception]]]:
+    """
+    Optimize many files in parallel, one worker process per CPU
+
+    Each file is independent, so throughput scales with core count. A file
+    that fails (unreadable, not UTF-8, ...) doesn't stop the others.
+
+    Returns:
+        ([(output_path, changes_list), ...], [(file_path, error), ...]),
+        both in input order
+    """
+    results = []
+    errors = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        futures = [pool.submit(_optimize_file, path, platform, config) for path in file_paths]
+        for path, future in zip(file_paths, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append((path, e))
+    return results, errors
+
 def main():
     """CLI interface"""
-    if len(sys.argv) < 3:
+    batch = len(sys.argv) > 1 and sys.argv[1] == '--batch'
+    if len(sys.argv) < 3 or (batch and len(sys.argv) < 4):
         print("Usage: python platform_optimizer.py <file_path> <platform> [output_path]")
+        print("       python platform_optimizer.py <directory|'glob'> <platform>")
+        print("       python platform_optimizer.py --batch <file_path|directory>... <platform>")
         print("\nPlatforms:")
         print("  chatgpt    - Authority, credentials, depth")
         print("  perplexity - Freshness, inline citations (3.2x citations if fresh)")
@@ -434,69 +1025,52 @@ def main():
         print("\nExample:")
         print("  python platform_optimizer.py page.html perplexity")
         print("  python platform_optimizer.py page.html grokipedia")
+        print("  python platform_optimizer.py --batch site/*.html multi")
+        print("  python platform_optimizer.py site/ multi")
         sys.exit(1)
-    
-    file_path = sys.argv[1]
-    platform = sys.argv[2].lower()
-    output_path = sys.argv[3] if len(sys.argv) > 3 else None
-    
-    # Read file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    # Basic config (user can customize)
-    config = {
-        'author': {
-            'name': 'Expert Author',
-            'credentials': 'PhD'
-        },
-        'title': 'Article Title',
-        'add_references': True,
-        'add_methodology': True,
-        'add_limitations': True,
-        'add_data_sources': True,
-        'add_inline_citations': True,
-        'make_citations_clickable': True
-    }
-    
+
+    if batch or os.path.isdir(sys.argv[1]) or _is_pattern(sys.argv[1]):
+        # Batch, or a directory or quoted glob: optimize every match in parallel
+        platform = sys.argv[-1 if batch else 2].lower()
+        try:
+            file_paths = _expand_paths(sys.argv[2:-1] if batch else [sys.argv[1]], platform)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        batch = True
+        output_path = None
+    else:
+        file_paths = [sys.argv[1]]
+        platform = sys.argv[2].lower()
+        output_path = sys.argv[3] if len(sys.argv) > 3 else None
+
+    if platform != 'multi' and platform not in PLATFORM_FUNCS:
+        print(f"Unknown platform: {platform}")
+        sys.exit(1)
+
     print(f"Optimizing for: {platform.upper()}")
     print("=" * 60)
-    
-    # Apply optimization
-    if platform == 'multi':
-        optimized, changes = optimize_multi_platform(
-            html_content,
-            ['chatgpt', 'perplexity', 'claude', 'gemini', 'grokipedia'],
-            config
-        )
-    elif platform == 'chatgpt':
-        optimized, changes = optimize_for_chatgpt(html_content, config)
-    elif platform == 'perplexity':
-        optimized, changes = optimize_for_perplexity(html_content, config)
-    elif platform == 'claude':
-        optimized, changes = optimize_for_claude(html_content, config)
-    elif platform == 'gemini':
-        optimized, changes = optimize_for_gemini(html_content, config)
-    elif platform == 'grokipedia':
-        optimized, changes = optimize_for_grokipedia(html_content, config)
+
+    _prune_cache()
+
+    errors = []
+    if batch:
+        results, errors = optimize_batch(file_paths, platform, CLI_CONFIG)
     else:
-        print(f"Unknown platform: {platform}")
+        results = [_optimize_file(file_paths[0], platform, CLI_CONFIG, output_path)]
+
+    if results:
+        print(f"✓ Optimization complete")
+    for output_path, changes in results:
+        print(f"  Output: {output_path}")
+        print(f"\nChanges applied ({len(changes)}):")
+        for change in changes:
+            print(f"  - {change}")
+
+    for path, error in errors:
+        print(f"Error: {path}: {error}")
+    if errors:
         sys.exit(1)
-    
-    # Determine output path
-    if output_path is None:
-        base = file_path.rsplit('.', 1)[0]
-        output_path = f"{base}-{platform}.html"
-    
-    # Write optimized file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(optimized)
-    
-    print(f"✓ Optimization complete")
-    print(f"  Output: {output_path}")
-    print(f"\nChanges applied ({len(changes)}):")
-    for change in changes:
-        print(f"  - {change}")
 
 if __name__ == '__main__':
     main()
@@ -2,39 +2,83 @@
 """Voice Search Optimizer - Generate featured snippet content and Speakable schema"""
 import json, sys, re
 from datetime import datetime
+from functools import lru_cache
+
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
 
 def generate_featured_snippet(text: str, max_words: int = 40) -> str:
     """Extract 30-40 word summary for featured snippets"""
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    # Walk sentence boundaries lazily: only the opening sentences are
+    # needed, so long texts are never split in full
     words = []
-    for s in sentences:
-        words.extend(s.split())
+    start = 0
+    for boundary in _SENT_RE.finditer(text):
+        words.extend(text[start:boundary.start()].split())
+        start = boundary.end()
         if len(words) >= 30:
             break
+    else:
+        words.extend(text[start:].split())
     return ' '.join(words[:max_words])
 
-def add_speakable_schema(html: str, sections: list) -> str:
-    """Add Speakable schema for 20-30 second segments"""
+# A site uses one or two selector lists for every page, so each distinct
+# block is rendered (and encoded) once and reused; keyed on a tuple
+@lru_cache(maxsize=32)
+def _speakable_script(sections: tuple) -> str:
+    """Speakable schema <script> block for 20-30 second segments"""
     schema = {
         "@context": "https://schema.org",
         "@type": "WebPage",
         "speakable": {
             "@type": "SpeakableSpecification",
-            "cssSelector": sections or [".tldr", "h2", "h3"]
+            "cssSelector": list(sections) or [".tldr", "h2", "h3"]
         }
     }
-    return html.replace('</head>', f'<script type="application/ld+json">\n{json.dumps(schema, indent=2)}\n</script>\n</head>')
+    return f'<script type="application/ld+json">\n{json.dumps(schema, indent=2)}\n</script>\n'
+
+@lru_cache(maxsize=32)
+def _speakable_block(sections: tuple) -> bytes:
+    return _speakable_script(sections).encode('utf-8')
+
+def add_speakable_schema(html: str, sections: list) -> str:
+    """Add Speakable schema for 20-30 second segments"""
+    return html.replace('</head>', _speakable_script(tuple(sections or ())) + '</head>')
+
+def write_with_insertions(html: bytes, insertions: dict, out) -> None:
+    """Stream html to binary file out with insertions[anchor] before every anchor
+
+    All anchor offsets are collected first (one str.find walk per anchor),
+    then the document is written once as memoryview slices interleaved with
+    the inserted blocks, so several injections cost a single output pass.
+    """
+    offsets = []
+    for order, anchor in enumerate(insertions):
+        idx = html.find(anchor)
+        while idx != -1:
+            offsets.append((idx, order, insertions[anchor]))
+            idx = html.find(anchor, idx + len(anchor))
+    offsets.sort(key=lambda offset: offset[:2])
+    view = memoryview(html)
+    start = 0
+    for idx, _, block in offsets:
+        out.write(view[start:idx])
+        out.write(block)
+        start = idx
+    out.write(view[start:])
+
+def write_speakable_schema(html: bytes, sections: list, out) -> None:
+    """Stream html to binary file out with the Speakable schema before </head>"""
+    write_with_insertions(html, {b'</head>': _speakable_block(tuple(sections or ()))}, out)
 
 def main():
     if len(sys.argv) < 2:
         print("Usage: python voice_optimizer.py <file>")
         sys.exit(1)
-    with open(sys.argv[1], 'r') as f:
+    with open(sys.argv[1], 'rb') as f:
         html = f.read()
-    optimized = add_speakable_schema(html, [".tldr", "h2"])
     output = sys.argv[1].replace('.html', '-voice.html')
-    with open(output, 'w') as f:
-        f.write(optimized)
+    with open(output, 'wb') as f:
+        write_speakable_schema(html, [".tldr", "h2"], f)
     print(f"✓ Voice optimization complete: {output}")
 
 if __name__ == '__main__':